@@ -1,7 +1,10 @@
 import logging
+import multiprocessing
 import os
 import threading
 import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional
 
 import enums
@@ -12,7 +15,7 @@
 from finding import Finding
 from job import Job, JobQueue
 from PAN import PAN
-from scanner import ScannerBase
+from scanner import ScannerBase, init_worker, scan_in_worker
 
 
 class Dispatcher:
@@ -21,10 +24,14 @@ class Dispatcher:
 
     __size_limit: int
     _stop_flag: bool
+    _executor: Optional[ProcessPoolExecutor]
+    _executor_failed: bool
 
     def __init__(self) -> None:
         self.__size_limit = PANHuntConfiguration().size_limit
         self._stop_flag = False
+        self._executor = None
+        self._executor_failed = False
         self.findings = []
         self.failures = []
 
@@ -41,24 +48,68 @@ def stop(self) -> None:
 
     def _run_dispatch_loop(self) -> None:
         job_queue = JobQueue()
-        while not self._stop_flag and not job_queue.is_finished():
-            if job_queue.has_jobs():
-                job: Optional[Job] = job_queue.dequeue()
-                if job:
-                    try:
-                        res: Optional[Finding] = self._dispatch_job(job)
-                        if res is not None:
-                            if res.status == enums.ScanStatusEnum.Success:
-                                self.findings.append(res)
+        try:
+            while not self._stop_flag and not job_queue.is_finished():
+                if job_queue.has_jobs():
+                    job: Optional[Job] = job_queue.dequeue()
+                    if job:
+                        deferred: bool = False
+                        try:
+                            res: Optional[Finding] | Future = self._dispatch_job(
+                                job)
+                            if isinstance(res, Future):
+                                # The worker callback completes the job
+                                deferred = True
                             else:
-                                self.failures.append(res)
-                    finally:
-                        # Mark the job as completed
-                        job_queue.complete_job()
+                                self._record_finding(res)
+                        finally:
+                            # Mark the job as completed
+                            if not deferred:
+                                job_queue.complete_job()
+                else:
+                    time.sleep(0.1)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _record_finding(self, res: Optional[Finding]) -> None:
+        if res is not None:
+            if res.status == enums.ScanStatusEnum.Success:
+                self.findings.append(res)
             else:
-                time.sleep(0.1)
-
-    def _dispatch_job(self, job: Job) -> Optional[Finding]:
+                self.failures.append(res)
+
+    @staticmethod
+    def _get_log_settings() -> tuple[Optional[str], Optional[str], str, Optional[str], int]:
+        """The log file, encoding, format and date format main() configured, and the level, for the workers to log the same way."""
+        root: logging.Logger = logging.getLogger()
+        for handler in root.handlers:
+            if isinstance(handler, logging.FileHandler):
+                formatter: Optional[logging.Formatter] = handler.formatter
+                return (handler.baseFilename, handler.encoding,
+                        (formatter._fmt if formatter else None) or logging.BASIC_FORMAT,
+                        formatter.datefmt if formatter else None, root.level)
+        return None, None, logging.BASIC_FORMAT, None, root.level
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Create the worker pool on first use. Returns None when processes are not available."""
+        if self._executor is None and not self._executor_failed:
+            try:
+                # spawn behaves the same on every platform and does not inherit the dispatcher thread state
+                # max_workers None is os.cpu_count(), capped at 61 on Windows where more raises ValueError
+                self._executor = ProcessPoolExecutor(
+                    max_workers=None,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=init_worker,
+                    initargs=(PANHuntConfiguration().excluded_pans, *Dispatcher._get_log_settings()))
+            except (OSError, NotImplementedError, ValueError) as ex:
+                logging.warning(
+                    f'Worker processes are not available, scanning in-process: {ex}')
+                self._executor_failed = True
+        return self._executor
+
+    def _dispatch_job(self, job: Job) -> Optional[Finding] | Future:
 
         logging.info(f"Processing job: {job.abspath}")
 
@@ -105,7 +156,7 @@ def _dispatch_job(self, job: Job) -> Optional[Finding]:
             return self._scan_file(job, mime_type, encoding)
 
     def _scan_file(self, job: Job,
-                   mimetype: str, encoding: str) -> None | Finding:
+                   mimetype: str, encoding: str) -> None | Finding | Future:
         # Scanning logic
         scanner: Optional[type[ScannerBase]] = mappings.get_scanner_by_file(
             mime_type=mimetype,
@@ -114,6 +165,24 @@ def _scan_file(self, job: Job,
         if not scanner:
             return None
 
+        if scanner.parallel:
+            executor: Optional[ProcessPoolExecutor] = self._get_executor()
+            if executor is not None:
+                try:
+                    future: Future = executor.submit(
+                        scan_in_worker, scanner, job, encoding)
+                except (BrokenProcessPool, RuntimeError) as ex:
+                    # a worker died and broke the pool, this and later jobs are scanned in-process
+                    logging.warning(
+                        f'Worker pool is no longer usable, scanning in-process: {ex}')
+                    self._executor_failed = True
+                    self._executor = None
+                    executor.shutdown(wait=False, cancel_futures=True)
+                else:
+                    future.add_done_callback(
+                        lambda f: self._complete_worker_scan(job, mimetype, encoding, f))
+                    return future
+
         scanner_instance = scanner()
 
         finding = None
@@ -130,3 +199,25 @@ def _scan_file(self, job: Job,
             finding.set_error(str(ex))
         finally:
             return finding
+
+    def _complete_worker_scan(self, job: Job, mimetype: str, encoding: str, future: Future) -> None:
+        finding: Optional[Finding] = None
+        try:
+            if future.cancelled():
+                # the pool was shut down before the worker started the job
+                raise CancelledError(
+                    f'Scan of \"{job.basename}\" was cancelled')
+            matches, children = future.result()
+            for child in children:
+                JobQueue().enqueue(child)
+            if matches and len(matches) > 0:
+                finding = Finding(
+                    basename=job.basename, dirname=job.dirname, payload=job.payload, mimetype=mimetype, encoding=encoding)
+                finding.matches = matches
+        except (CancelledError, Exception) as ex:
+            finding = Finding(
+                basename=job.basename, dirname=job.dirname, payload=job.payload, mimetype=mimetype, encoding=encoding)
+            finding.set_error(str(ex))
+        finally:
+            self._record_finding(finding)
+            JobQueue().complete_job()
@@ -9,22 +9,111 @@
 # Contributors: Zafer Balkan, 2023
 
 import logging
+import mmap
 import os
 import struct
 from datetime import datetime, timedelta
-from io import BufferedReader
-from typing import Literal, Optional, Union
+from functools import cached_property
+from io import BufferedReader, BytesIO, UnsupportedOperation
+from types import MappingProxyType
+from typing import Literal, Mapping, Optional, Union
 
 import panutils
 from enums import PropIdEnum, PTypeEnum
 from exceptions import PANHuntException
 
-_FilePathOrFileObject = Union[BufferedReader, int, str, bytes, os.PathLike[
+_FilePathOrFileObject = Union[BufferedReader, BytesIO, int, str, bytes, os.PathLike[
     str], os.PathLike[bytes]]
 
 _ValueType = Optional[Union[int, float, datetime, bool, str, bytes,
                             list[int], list[float], list[datetime], list[bytes], list[str]]]
 
+_DirectoryEntryFields = tuple[bytes, int, int, int,
+                              int, int, bytes, int, bytes, bytes, int, int]
+
+_FILETIME_EPOCH: datetime = datetime(year=1601, month=1, day=1)
+_FLOATINGTIME_EPOCH: datetime = datetime(year=1899, month=12, day=30)
+_ZERO_FILETIME: bytes = b'\x00' * 8
+
+# plain ints, PropIdEnum member .value lookups are slow on the per property path
+_PID_RECIPIENT_TYPE: int = PropIdEnum.PidTagRecipientType.value
+_PID_DISPLAY_NAME: int = PropIdEnum.PidTagDisplayName.value
+_PID_OBJECT_TYPE: int = PropIdEnum.PidTagObjectType.value
+_PID_ADDRESS_TYPE: int = PropIdEnum.PidTagAddressType.value
+_PID_EMAIL_ADDRESS: int = PropIdEnum.PidTagEmailAddress.value
+_PID_DISPLAY_TYPE: int = PropIdEnum.PidTagDisplayType.value
+_PID_ATTACH_METHOD: int = PropIdEnum.PidTagAttachMethod.value
+_PID_ATTACH_FILENAME: int = PropIdEnum.PidTagAttachFilename.value
+_PID_ATTACH_LONG_FILENAME: int = PropIdEnum.PidTagAttachLongFilename.value
+_PID_ATTACH_DATA_BINARY: int = PropIdEnum.PidTagAttachDataBinary.value
+_PID_ATTACH_EXTENSION: int = PropIdEnum.PidTagAttachExtension.value
+_PID_ATTACHMENT_SIZE: int = PropIdEnum.PidTagAttachmentSize.value
+_PID_ATTACH_MIME_TAG: int = PropIdEnum.PidTagAttachMimeTag.value
+_PID_SUBJECT: int = PropIdEnum.PidTagSubjectW.value
+_PID_MESSAGE_FLAGS: int = PropIdEnum.PidTagMessageFlags.value
+_PID_BODY: int = PropIdEnum.PidTagBody.value
+_PID_DISPLAY_TO: int = PropIdEnum.PidTagDisplayToW.value
+_PID_CLIENT_SUBMIT_TIME: int = PropIdEnum.PidTagClientSubmitTime.value
+_PID_SENT_REPRESENTING_NAME: int = PropIdEnum.PidTagSentRepresentingNameW.value
+_PID_SENDER_NAME: int = PropIdEnum.PidTagSenderName.value
+_PID_SENDER_SMTP_ADDRESS: int = PropIdEnum.PidTagSenderSmtpAddress.value
+_PID_MESSAGE_DELIVERY_TIME: int = PropIdEnum.PidTagMessageDeliveryTime.value
+_PID_MESSAGE_STATUS: int = PropIdEnum.PidTagMessageStatus.value
+_PID_MESSAGE_SIZE: int = PropIdEnum.PidTagMessageSize.value
+_PID_TRANSPORT_MESSAGE_HEADERS: int = PropIdEnum.PidTagTransportMessageHeaders.value
+_PID_X_ORIGINATING_IP: int = PropIdEnum.PidTagXOriginatingIp.value
+
+_U32 = struct.Struct('<I')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+
+# fixed size property types that decode with a single struct call
+_FIXED_SIZE_STRUCTS: dict[PTypeEnum, struct.Struct] = {
+    PTypeEnum.PtypInteger16: struct.Struct('<h'),
+    PTypeEnum.PtypInteger32: struct.Struct('<i'),
+    PTypeEnum.PtypFloating32: struct.Struct('<f'),
+    PTypeEnum.PtypFloating64: struct.Struct('<d'),
+    PTypeEnum.PtypErrorCode: struct.Struct('<I'),
+    PTypeEnum.PtypBoolean: struct.Struct('<?'),
+    PTypeEnum.PtypInteger64: struct.Struct('<q')
+}
+
+
+def _get_filetime(time_bytes: bytes) -> Optional[datetime]:
+    """returns None for an unset FILETIME"""
+
+    if time_bytes == _ZERO_FILETIME:
+        return None
+    return _FILETIME_EPOCH + timedelta(microseconds=_I64.unpack(time_bytes)[0] / 10.0)
+
+
+def _get_runs(sectors: list[int]) -> list[tuple[int, int]]:
+    """splits sectors into (first sector, sector count) runs of consecutive sector ids"""
+
+    runs: list[tuple[int, int]] = []
+    run_start: int = 0
+    for i in range(1, len(sectors) + 1):
+        if i < len(sectors) and sectors[i] == sectors[i - 1] + 1:
+            continue
+        runs.append((sectors[run_start], i - run_start))
+        run_start = i
+    return runs
+
+
+def _walk_chain(entries: list[int], sector: int, loop_message: str) -> list[int]:
+    """follows a FAT or mini FAT chain from sector to ENDOFCHAIN"""
+
+    chain: list[int] = []
+    append = chain.append
+    # a chain longer than the table must revisit a sector
+    for _ in range(len(entries) + 1):
+        if sector == FAT.ENDOFCHAIN:
+            return chain
+        append(sector)
+        sector = entries[sector]
+    raise PANHuntException(loop_message)
+
+
 ###################################################################################################################################
 #  __  __ ____         ____ _____ ____
 # |  \/  / ___|       / ___|  ___| __ )
@@ -44,30 +133,60 @@ class FAT:
 
     mscfb: 'MSCFB'
     entries: list[int]
+    chain_cache: dict[int, list[int]]
 
     def __init__(self, mscfb: 'MSCFB') -> None:
 
         self.mscfb = mscfb  # Microsoft Compound File Binary File
-        difat_index: int = 0
         self.entries = []
-        while mscfb.DIFAT[difat_index] != FAT.FREESECT:
-            sector: int = mscfb.DIFAT[difat_index]
-            sector_bytes: bytes = mscfb.get_sector_bytes(sector)
-            format: str = 'I' * (mscfb.SectorSize // 4)
-            sector_fat_entries = struct.unpack(format, sector_bytes)
-            self.entries.extend(sector_fat_entries)
-            difat_index += 1
+        self.chain_cache = {}
+        fat_sectors: list[int] = []
+        for sector in mscfb.DIFAT:
+            if sector == FAT.FREESECT:
+                break
+            fat_sectors.append(sector)
+        # FAT sectors are usually contiguous, so each run is unpacked with a single call
+        entries_per_sector: int = mscfb.SectorSize // 4
+        for run_sector, run_count in _get_runs(fat_sectors):
+            run_bytes: memoryview = mscfb.get_sector_bytes(
+                run_sector, run_count)
+            self.entries.extend(struct.unpack(
+                f'<{run_count * entries_per_sector}I', run_bytes))
+
+    def get_chain(self, sector: int) -> list[int]:
+        """returns the sector ids of the chain starting at sector, cached per starting sector"""
+
+        chain: Optional[list[int]] = self.chain_cache.get(sector)
+        if chain is None:
+            chain = _walk_chain(self.entries, sector, 'FAT chain contains a loop')
+            self.chain_cache[sector] = chain
+        return chain
 
     def get_stream(self, sector: int, size: int) -> bytes:
 
-        stream_bytes: bytes = b''
-        while sector != FAT.ENDOFCHAIN:
-            stream_bytes += self.mscfb.get_sector_bytes(sector)
-            sector = self.entries[sector]
-        if size > len(stream_bytes) or size < len(stream_bytes) - self.mscfb.SectorSize:
+        sector_size: int = self.mscfb.SectorSize
+        chain: list[int] = self.get_chain(sector)
+        if size > len(chain) * sector_size or size < (len(chain) - 1) * sector_size:
+            raise PANHuntException(
+                'FAT stream size does not match number of sectors')
+        runs: list[tuple[int, int]] = _get_runs(chain)
+        if len(runs) == 1:
+            # a contiguous stream is copied straight out of the file view
+            stream_view: memoryview = self.mscfb.get_sector_bytes(*runs[0])
+        else:
+            stream_view = memoryview(bytearray(len(chain) * sector_size))
+            stream_length: int = 0
+            for run_sector, run_count in runs:
+                run_bytes: memoryview = self.mscfb.get_sector_bytes(
+                    run_sector, run_count)
+                stream_view[stream_length:stream_length +
+                            len(run_bytes)] = run_bytes
+                stream_length += len(run_bytes)
+            stream_view = stream_view[:stream_length]
+        if size > len(stream_view):
             raise PANHuntException(
                 'FAT stream size does not match number of sectors')
-        return stream_bytes[:size]
+        return bytes(stream_view[:size])
 
     def __str__(self) -> str:
 
@@ -81,40 +200,73 @@ class MiniFAT:
     entries: list[int]
     mscfb: 'MSCFB'
     mini_stream_bytes: bytes
+    parsed: bool
+    chain_cache: dict[int, list[int]]
 
     def __init__(self, mscfb: 'MSCFB') -> None:
+        """the mini FAT and the mini stream are only read by the first get_stream call"""
 
         self.entries = []
         self.mscfb = mscfb
         self.mini_stream_bytes: bytes = b''
+        self.parsed = False
+        self.chain_cache = {}
 
-        current_sector: int = mscfb.FirstMiniFATSectorLocation
-        for _ in range(mscfb.MiniFATSectors):
-            sector_bytes: bytes = mscfb.get_sector_bytes(current_sector)
-            current_sector = panutils.as_int(mscfb.fat.entries[current_sector])
+    def parse(self) -> None:
+
+        if self.parsed:
+            return
+        self.parsed = True
+        current_sector: int = self.mscfb.FirstMiniFATSectorLocation
+        for _ in range(self.mscfb.MiniFATSectors):
+            sector_bytes: memoryview = self.mscfb.get_sector_bytes(
+                current_sector)
+            current_sector = panutils.as_int(
+                self.mscfb.fat.entries[current_sector])
             minifat_entries = struct.unpack(
-                'I' * int(mscfb.SectorSize / 4), sector_bytes)
+                'I' * int(self.mscfb.SectorSize / 4), sector_bytes)
             self.entries.extend(minifat_entries)
+        self.get_all_mini_stream_fat_sectors()
 
     def get_all_mini_stream_fat_sectors(self) -> None:
         if self.mscfb.MiniStreamSectorLocation != FAT.ENDOFCHAIN:
             self.mini_stream_bytes = self.mscfb.fat.get_stream(
                 self.mscfb.MiniStreamSectorLocation, self.mscfb.MiniStreamSize)
 
+    def get_chain(self, sector: int) -> list[int]:
+        """returns the mini sector ids of the chain starting at sector, cached per starting sector"""
+
+        chain: Optional[list[int]] = self.chain_cache.get(sector)
+        if chain is None:
+            chain = _walk_chain(self.entries, sector, 'Mini FAT chain contains a loop')
+            self.chain_cache[sector] = chain
+        return chain
+
     def get_stream(self, sector: int, size: int) -> bytes:
 
-        stream_bytes: bytes = b''
-        while sector != FAT.ENDOFCHAIN:
-            stream_bytes += self.mini_stream_bytes[sector *
-                                                   MiniFAT.SECTORSIZE: sector * MiniFAT.SECTORSIZE + MiniFAT.SECTORSIZE]
-            sector = self.entries[sector]
-        if size > len(stream_bytes) or size < len(stream_bytes) - MiniFAT.SECTORSIZE:
+        self.parse()
+        chain: list[int] = self.get_chain(sector)
+        stream_buffer: bytearray = bytearray(len(chain) * MiniFAT.SECTORSIZE)
+        stream_view: memoryview = memoryview(stream_buffer)
+        mini_stream_view: memoryview = memoryview(self.mini_stream_bytes)
+        stream_length: int = 0
+        # consecutive mini sectors are copied with a single slice assignment
+        for run_sector, run_count in _get_runs(chain):
+            run_offset: int = run_sector * MiniFAT.SECTORSIZE
+            run_bytes: memoryview = mini_stream_view[run_offset:run_offset +
+                                                     run_count * MiniFAT.SECTORSIZE]
+            stream_view[stream_length:stream_length +
+                        len(run_bytes)] = run_bytes
+            stream_length += len(run_bytes)
+        # the chain may hold at most one mini sector more than the stream size
+        if size > stream_length or size < stream_length - MiniFAT.SECTORSIZE:
             raise PANHuntException(
                 'Mini FAT mini stream size does not match number of mini sectors')
-        return stream_bytes[:size]
+        return bytes(stream_view[:size])
 
     def __str__(self) -> str:
 
+        self.parse()
         return ', '.join([f"{hex(sector)}:{hex(entry)}" for sector, entry in zip(list(range(len(self.entries))), self.entries)])
 
 
@@ -133,41 +285,45 @@ def __init__(self, mscfb: 'MSCFB') -> None:
     def get_all_directory_entries(self, start_sector: int) -> list['DirectoryEntry']:
 
         entries: list[DirectoryEntry] = []
-        sector: int = start_sector
-        while sector != FAT.ENDOFCHAIN:
+        for sector in self.mscfb.fat.get_chain(start_sector):
             entries.extend(self.get_directory_sector(sector))
-            sector = self.mscfb.fat.entries[sector]
         return entries
 
     def set_entry_children(self, dir_entry: 'DirectoryEntry') -> None:
+        """walks the red-black trees below dir_entry with explicit stacks instead of recursion"""
 
-        dir_entry.children = {}
-        child_ids_queue: list[int] = []
-        if dir_entry.ChildID != DirectoryEntry.NOSTREAM:
-            child_ids_queue.append(dir_entry.ChildID)
+        storages: list[DirectoryEntry] = [dir_entry]
+        visited: set[int] = set()
+        while storages:
+            storage: DirectoryEntry = storages.pop()
+            if id(storage) in visited:
+                raise PANHuntException(
+                    'Directory Entry tree contains a loop')
+            visited.add(id(storage))
+            storage.children = {}
+            child_ids_queue: list[int] = []
+            if storage.ChildID != DirectoryEntry.NOSTREAM:
+                child_ids_queue.append(storage.ChildID)
             while child_ids_queue:
-                child_entry: DirectoryEntry = self.entries[child_ids_queue.pop(
-                )]
-                if child_entry.Name in list(dir_entry.children.keys()):
+                child_entry: DirectoryEntry = self.entries[child_ids_queue.pop()]
+                if child_entry.Name in storage.children:
                     raise PANHuntException(
                         'Directory Entry Name already in children dictionary')
-                dir_entry.children[child_entry.Name] = child_entry
+                storage.children[child_entry.Name] = child_entry
                 if child_entry.SiblingID != DirectoryEntry.NOSTREAM:
                     child_ids_queue.append(child_entry.SiblingID)
                 if child_entry.RightSiblingID != DirectoryEntry.NOSTREAM:
                     child_ids_queue.append(child_entry.RightSiblingID)
                 if child_entry.ChildID != DirectoryEntry.NOSTREAM:
-                    self.set_entry_children(child_entry)
+                    storages.append(child_entry)
 
     def get_directory_sector(self, sector: int) -> list['DirectoryEntry']:
 
-        entries: list['DirectoryEntry'] = []
-        sector_bytes: bytes = self.mscfb.get_sector_bytes(sector)
-        sector_directory_entry_count: int = int(self.mscfb.SectorSize / 128)
-        for i in range(sector_directory_entry_count):
-            entries.append(DirectoryEntry(
-                self.mscfb, sector_bytes[DirectoryEntry.ENTRY_SIZE * i:DirectoryEntry.ENTRY_SIZE * i + DirectoryEntry.ENTRY_SIZE]))
-        return entries
+        sector_bytes: memoryview = self.mscfb.get_sector_bytes(sector)
+        # a truncated sector only yields its complete entries
+        entries_length: int = len(sector_bytes) - \
+            len(sector_bytes) % DirectoryEntry.ENTRY_SIZE
+        return [DirectoryEntry(self.mscfb, entry_fields) for entry_fields in DirectoryEntry.ENTRY_STRUCT.iter_unpack(sector_bytes[:entries_length])]
 
     def __str__(self) -> str:
 
@@ -176,7 +332,12 @@ def __str__(self) -> str:
 
 class DirectoryEntry:
 
+    __slots__ = ('mscfb', 'Name', 'ObjectType', 'ColorFlag', 'SiblingID', 'RightSiblingID', 'ChildID', 'CLSID', 'StateBits',
+                 'creation_time_bytes', 'modified_time_bytes', 'StartingSectorLocation', 'StreamSize', 'stream_data', 'children')
     ENTRY_SIZE = 128
+    # Name, (NameLength skipped), ObjectType, ColorFlag, SiblingID, RightSiblingID, ChildID, CLSID, StateBits,
+    # CreationTime, ModifiedTime, StartingSectorLocation, StreamSize
+    ENTRY_STRUCT = struct.Struct('<64s2xBBIII16sI8s8sIQ')
     OBJECT_UNKNOWN = 0x0
     OBJECT_STORAGE = 0x1  # folder
     OBJECT_STREAM = 0x2  # file
@@ -191,53 +352,39 @@ class DirectoryEntry:
     ChildID: int
     CLSID: bytes
     StateBits: int
-    CreationTime: Optional[datetime]
-    ModifiedTime: Optional[datetime]
+    creation_time_bytes: bytes
+    modified_time_bytes: bytes
     StreamSize: int
     StartingSectorLocation: int
     stream_data: bytes
     children: dict[str, 'DirectoryEntry']
 
-    def __init__(self, mscfb: 'MSCFB', directory_bytes: bytes) -> None:
-
-        raw_size: int = len(directory_bytes)
-        if raw_size != DirectoryEntry.ENTRY_SIZE:
-            # raise MSGException('Directory Entry not 128 bytes')
-            # print('Directory Entry not 128 bytes')
-            return
+    def __init__(self, mscfb: 'MSCFB', entry_fields: _DirectoryEntryFields) -> None:
+        """entry_fields is one record unpacked with DirectoryEntry.ENTRY_STRUCT"""
 
         self.mscfb = mscfb
-        nameLength: int = panutils.unpack_integer('H', directory_bytes[64:66])
-        if nameLength > 64:
-            # raise MSGException('Directory Entry name cannot be longer than 64')
-            # print('Directory Entry name cannot be longer than 64')
-            return
-        self.Name: str = directory_bytes[:nameLength -
-                                         2].decode('utf-16-le')
-        self.ObjectType, self.ColorFlag = struct.unpack(
-            'BB', directory_bytes[66:68])
-        self.SiblingID, self.RightSiblingID, self.ChildID = struct.unpack(
-            'III', directory_bytes[68:80])
-        self.CLSID = panutils.unpack_bytes('16s', directory_bytes[80:96])
-        self.StateBits = panutils.unpack_integer('I', directory_bytes[96:100])
-        creation_time_bytes, modified_time_bytes = struct.unpack(
-            '8s8s', directory_bytes[100:116])
-        if creation_time_bytes == '\x00' * 8:
-            self.CreationTime = None
-        else:
-            self.CreationTime = panutils.bytes_to_time(creation_time_bytes)
-        if modified_time_bytes == '\x00' * 8:
-            self.ModifiedTime = None
-        else:
-            self.ModifiedTime = panutils.bytes_to_time(modified_time_bytes)
-        self.StartingSectorLocation = panutils.unpack_integer(
-            'I', directory_bytes[116:120])
-        self.StreamSize = panutils.unpack_integer(
-            'Q', directory_bytes[120:128])
+        name_bytes: bytes
+        name_bytes, self.ObjectType, self.ColorFlag, self.SiblingID, self.RightSiblingID, self.ChildID, \
+            self.CLSID, self.StateBits, self.creation_time_bytes, self.modified_time_bytes, self.StartingSectorLocation, \
+            self.StreamSize = entry_fields
+        # the name is null terminated within its fixed 64 byte field, unused entries are all zero
+        self.Name: str = name_bytes.decode(
+            'utf-16-le', errors='ignore').partition('\x00')[0]
         if mscfb.MajorVersion == 3:
             self.StreamSize = self.StreamSize & 0xFFFFFFFF  # upper 32 bits may not be zero
         self.children = {}
 
+    @property
+    def CreationTime(self) -> Optional[datetime]:
+        """decoded on access, most entries never have their timestamps read"""
+
+        return _get_filetime(self.creation_time_bytes)
+
+    @property
+    def ModifiedTime(self) -> Optional[datetime]:
+
+        return _get_filetime(self.modified_time_bytes)
+
     def __cmp__(self, other: 'DirectoryEntry') -> bool:
         return self.Name == other.Name
 
@@ -263,7 +410,7 @@ def list_children(self, level: int = 0, expand: bool = False) -> str:
         for child_entry in sorted_entries:
             line_sfx: str = ''
             if child_entry.ObjectType == DirectoryEntry.OBJECT_STORAGE:
-                line_sfx = f"({len(list(child_entry.children.keys()))})"
+                line_sfx = f"({len(child_entry.children)})"
             s += f"{(line_pfx, child_entry.Name, line_sfx)}\n"
             if expand:
                 s += child_entry.list_children(level + 1, expand)
@@ -274,7 +421,15 @@ def __str__(self) -> str:
 
 
 class MSCFB:
-    fd: BufferedReader
+
+    SIGNATURE: bytes = b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1'
+    # Signature, CLSID, MinorVersion, MajorVersion, ByteOrder, SectorShift, MiniSectorShift, Reserved,
+    # DirectorySector, FATSectors, FirstDirectorySectorLocation, TransactionSignatureNumber,
+    # MiniStreamCutoffSize, FirstMiniFATSectorLocation, MiniFATSectors, FirstDIFATSectorLocation, DIFATSectors, DIFAT[109]
+    HEADER_STRUCT = struct.Struct('<8s16sHHHHH6sIIIIIIIII109I')
+
+    fd: Union[BufferedReader, BytesIO]
+    data: memoryview
     fat: FAT
     minifat: MiniFAT
     directory: Directory
@@ -301,9 +456,9 @@ class MSCFB:
     CLSID: bytes
 
     def __init__(self, cfb_file: _FilePathOrFileObject) -> None:
-        """cfb_file is unicode or string filename or a file object"""
+        """cfb_file is unicode or string filename, a file object or an in memory BytesIO"""
 
-        if isinstance(cfb_file, BufferedReader):
+        if isinstance(cfb_file, (BufferedReader, BytesIO)):
             self.fd = cfb_file
         else:
             self.fd = open(cfb_file, 'rb')
@@ -313,6 +468,8 @@ def __init__(self, cfb_file: _FilePathOrFileObject) -> None:
             # DevSkim: ignore DS187371
             logging.debug(f'Skipping invalid MSG file: {cfb_file!r}')
             return
+        # every sector is visited anyway, so sectors are served from memory
+        self.data = self.get_file_view(self.fd)
         if self.MajorVersion == 3:
             self.SectorSize = 512
         else:  # 4
@@ -324,26 +481,33 @@ def __init__(self, cfb_file: _FilePathOrFileObject) -> None:
         self.MiniStreamSectorLocation = self.directory.entries[0].StartingSectorLocation
         # Root directory entry
         self.MiniStreamSize = self.directory.entries[0].StreamSize
-        self.minifat.get_all_mini_stream_fat_sectors()
 
-    def read_header(self, fd: BufferedReader) -> None:
+    def get_file_view(self, fd: Union[BufferedReader, BytesIO]) -> memoryview:
+        """maps the file read only, in memory and unmappable files fall back to their contents"""
+
+        if isinstance(fd, BytesIO):
+            # shares the buffer the BytesIO was created with
+            return memoryview(fd.getvalue())
+        try:
+            return memoryview(mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError, UnsupportedOperation):
+            fd.seek(0)
+            return memoryview(fd.read())
+
+    def read_header(self, fd: Union[BufferedReader, BytesIO]) -> None:
 
         self.validCFB = False
         fd.seek(0)
-        self.signature = fd.read(8)
-        if self.signature != b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1':
+        header_bytes: bytes = fd.read(MSCFB.HEADER_STRUCT.size)
+        if header_bytes[:8] != MSCFB.SIGNATURE or len(header_bytes) < MSCFB.HEADER_STRUCT.size:
             return
-        self.CLSID = fd.read(16)
-        self.MinorVersion, self.MajorVersion, self.ByteOrder, self.SectorShift, self.MiniSectorShift = struct.unpack(
-            'HHHHH', fd.read(10))
+        header_fields = MSCFB.HEADER_STRUCT.unpack(header_bytes)
+        self.signature, self.CLSID, self.MinorVersion, self.MajorVersion, self.ByteOrder, self.SectorShift, self.MiniSectorShift = header_fields[:7]
         if self.MajorVersion not in (3, 4):
             return
-        _ = fd.read(6)
-        self.DirectorySector, self.FATSectors, self.FirstDirectorySectorLocation, self.TransactionSignatureNumber = struct.unpack(
-            'IIII', fd.read(16))
-        self.MiniStreamCutoffSize, self.FirstMiniFATSectorLocation, self.MiniFATSectors, self.FirstDIFATSectorLocation, self.DIFATSectors = struct.unpack(
-            'IIIII', fd.read(20))
-        self.DIFAT = list(struct.unpack('I' * 109, fd.read(436)))
+        self.DirectorySector, self.FATSectors, self.FirstDirectorySectorLocation, self.TransactionSignatureNumber = header_fields[8:12]
+        self.MiniStreamCutoffSize, self.FirstMiniFATSectorLocation, self.MiniFATSectors, self.FirstDIFATSectorLocation, self.DIFATSectors = header_fields[12:17]
+        self.DIFAT = list(header_fields[17:])
         self.validCFB = True
 
         if self.FirstDIFATSectorLocation != FAT.ENDOFCHAIN:
@@ -353,11 +517,11 @@ def get_sector_offset(self, sector: int) -> int:
 
         return (sector + 1) * self.SectorSize
 
-    def get_sector_bytes(self, sector: int) -> bytes:
+    def get_sector_bytes(self, sector: int, count: int = 1) -> memoryview:
+        """returns count consecutive sectors starting at sector"""
 
         offset: int = self.get_sector_offset(sector)
-        self.fd.seek(offset)
-        return self.fd.read(self.SectorSize)
+        return self.data[offset:offset + count * self.SectorSize]
 
     def __del__(self) -> None:
         self.fd.close()
@@ -379,8 +543,15 @@ class PropertyStream:
     TOPLEVEL_HEADER_SIZE: int = 32
     RECIP_OR_ATTACH_HEADER_SIZE: int = 8
     EMBEDDED_MSG_HEADER_SIZE: int = 24
+    # Reserved, NextRecipientID, NextAttachmentID, RecipientCount, AttachmentCount
+    HEADER_STRUCT = struct.Struct('<8sIIII')
+    # the PropertyID is the upper half of the little endian PropertyTag at the start of each 16 byte entry
+    PROPERTY_ID_STRUCT = struct.Struct('<2xH12x')
 
     msmsg: 'MSMSG'
+    parent_dir_entry: DirectoryEntry
+    property_bytes: bytes
+    property_offsets: dict[int, int]
     properties: dict[int, 'PropertyEntry']
     NextRecipientID: int
     NextAttachmentID: int
@@ -390,40 +561,54 @@ class PropertyStream:
     def __init__(self, msmsg_obj: 'MSMSG', parent_dir_entry: DirectoryEntry, header_size: int) -> None:
 
         self.msmsg = msmsg_obj
+        self.properties = {}
+        self.reset(parent_dir_entry, header_size)
+
+    def reset(self, parent_dir_entry: DirectoryEntry, header_size: int) -> None:
+        """re-points the stream at the property stream of another storage of the same message"""
+
+        self.parent_dir_entry = parent_dir_entry
         property_dir_entry: DirectoryEntry = parent_dir_entry.children[
             PropertyStream.PROPERTY_STREAM_NAME]
         property_bytes: bytes = property_dir_entry.get_data()
-        self.properties = {}
+        self.property_bytes = property_bytes
+        self.property_offsets = {}
+        self.properties.clear()
         if property_bytes:
             if header_size >= PropertyStream.EMBEDDED_MSG_HEADER_SIZE:
-                _, self.NextRecipientID, self.NextAttachmentID, self.RecipientCount, self.AttachmentCount = struct.unpack(
-                    '8sIIII', property_bytes[:24])
+                _, self.NextRecipientID, self.NextAttachmentID, self.RecipientCount, self.AttachmentCount = PropertyStream.HEADER_STRUCT.unpack_from(
+                    property_bytes)
             if (len(property_bytes) - header_size) % 16 != 0:
                 raise PANHuntException(
                     'Property Stream size less header is not exactly divisible by 16')
-            property_entries_count: int = int(
-                (len(property_bytes) - header_size) / 16)
-            for i in range(property_entries_count):
-                prop_entry: PropertyEntry = PropertyEntry(
-                    self.msmsg, parent_dir_entry, property_bytes[header_size + i * 16: header_size + i * 16 + 16])
-                if prop_entry in self.properties.values():
-                    raise PANHuntException(
-                        'PropertyID already in properties dictionary')
-                self.properties[prop_entry.PropertyID] = prop_entry
+            # only the entry offsets are indexed here, entries are decoded by get_value on first access
+            self.property_offsets = {prop_id: header_size + index * 16 for index, (prop_id,) in enumerate(
+                PropertyStream.PROPERTY_ID_STRUCT.iter_unpack(property_bytes[header_size:]))}
+            if len(self.property_offsets) != (len(property_bytes) - header_size) // 16:
+                raise PANHuntException(
+                    'PropertyID already in properties dictionary')
 
     def get_value(self, prop_id: int) -> 'PropertyEntry':  # type: ignore
 
         if prop_id in self.properties:
             return self.properties[prop_id]
+        if prop_id in self.property_offsets:
+            prop_entry: PropertyEntry = PropertyEntry(
+                self.msmsg, self.parent_dir_entry, *PropertyEntry.ENTRY_STRUCT.unpack_from(self.property_bytes, self.property_offsets[prop_id]))
+            self.properties[prop_id] = prop_entry
+            return prop_entry
         # raise IndexError('prop_id')
 
     def __str__(self) -> str:
-        return '\n'.join([str(prop) for prop in list(self.properties.values())])
+        return '\n'.join([str(self.get_value(prop_id)) for prop_id in self.property_offsets])
 
 
 class PropertyEntry:
 
+    __slots__ = ('PropertyTag', 'Flags', 'PropertyID', 'PropertyType', 'size', 'name', 'value')
     SUB_PREFIX: str = '__substg1.0_'
+    # PropertyTag, Flags, Value (fixed size value or size of the variable size value)
+    ENTRY_STRUCT = struct.Struct('<II8s')
 
     PropertyTag: int
     Flags: int
@@ -433,20 +618,17 @@ class PropertyEntry:
     name: str
     value: _ValueType
 
-    def __init__(self, msmsg: 'MSMSG', parent_dir_entry: DirectoryEntry, property_entry_bytes: bytes) -> None:
-        propertyTag: int
-        Flags: int
-        propertyTag, Flags = struct.unpack('II', property_entry_bytes[:8])
+    def __init__(self, msmsg: 'MSMSG', parent_dir_entry: DirectoryEntry, property_tag: int, flags: int, value_bytes: bytes) -> None:
+        """property_tag, flags and value_bytes are one record unpacked with PropertyEntry.ENTRY_STRUCT"""
 
-        self.PropertyTag = propertyTag
-        self.Flags = Flags
+        self.PropertyTag = property_tag
+        self.Flags = flags
         self.PropertyID = self.PropertyTag >> 16
         self.PropertyType = self.PropertyTag & 0xFFFF
         ptype: MsgPTypeWrapper = msmsg.ptype_mapping[PTypeEnum(
             self.PropertyType)]
         if ptype.is_variable or ptype.is_multi:
-            self.size = panutils.unpack_integer(
-                'I', property_entry_bytes[8:12])
+            self.size = _U32.unpack_from(value_bytes)[0]
             stream_name: str = PropertyEntry.SUB_PREFIX + \
                 panutils.to_zeropaddedhex(self.PropertyTag, 8)
             property_bytes: bytes = parent_dir_entry.children[stream_name].get_data(
@@ -463,13 +645,11 @@ def __init__(self, msmsg: 'MSMSG', parent_dir_entry: DirectoryEntry, property_en
                 else:  # PtypMultipleString8 or PtypMultipleString
                     len_item_size = 4
 
-                value_lengths: list[int] = []
-                for i in range(int(len(property_bytes) / len_item_size)):
-                    value_lengths.append(panutils.unpack_integer(
-                        'I', property_bytes[i * len_item_size:i * len_item_size + 4]))
+                # one length entry per value, each value is stored in its own stream
+                value_count: int = len(property_bytes) // len_item_size
 
                 property_byte_list: list[bytes] = []
-                for i in range(len(value_lengths)):
+                for i in range(value_count):
                     index_stream_name: str = f"{stream_name}-{panutils.to_zeropaddedhex(i, 8)}"
                     property_byte_list.append(
                         parent_dir_entry.children[index_stream_name].get_data())
@@ -481,7 +661,7 @@ def __init__(self, msmsg: 'MSMSG', parent_dir_entry: DirectoryEntry, property_en
 
         else:  # fixed size
             self.size = ptype.byte_count
-            self.value = ptype.get_value(property_entry_bytes[8:8 + self.size])
+            self.value = ptype.get_value(value_bytes[:self.size])
 
     def __str__(self) -> str:
         return f"{hex(self.PropertyTag)}-{str(self.value)}"
@@ -489,6 +669,7 @@ def __str__(self) -> str:
 
 class MsgPTypeWrapper:
 
+    __slots__ = ('ptype', 'byte_count', 'is_variable', 'is_multi')
     ptype: PTypeEnum
     byte_count: int
     is_variable: bool
@@ -501,40 +682,19 @@ def __init__(self, ptype: PTypeEnum, byte_count: int, is_variable: bool, is_mult
     def get_value(self, payload: bytes) -> _ValueType:
         """payload is normally a string of bytes, but if multi and variable, bytes is a list of bytes"""
 
-        if self.ptype == PTypeEnum.PtypInteger16:
-            return panutils.unpack_integer('h', payload)
-        if self.ptype == PTypeEnum.PtypInteger32:
-            return panutils.unpack_integer('i', payload)
-        if self.ptype == PTypeEnum.PtypFloating32:
-            return panutils.unpack_float('f', payload)
-        if self.ptype == PTypeEnum.PtypFloating64:
-            return panutils.unpack_float('d', payload)
+        fixed_struct: Optional[struct.Struct] = _FIXED_SIZE_STRUCTS.get(
+            self.ptype)
+        if fixed_struct is not None:
+            return fixed_struct.unpack(payload)[0]
         if self.ptype == PTypeEnum.PtypCurrency:
             raise NotImplementedError('PtypCurrency')
         if self.ptype == PTypeEnum.PtypFloatingTime:
             return self.get_floating_time(payload)
-        if self.ptype == PTypeEnum.PtypErrorCode:
-            return panutils.unpack_integer('I', payload)
-        if self.ptype == PTypeEnum.PtypBoolean:
-            return panutils.unpack_integer('B', payload) != 0
-        if self.ptype == PTypeEnum.PtypInteger64:
-            return panutils.unpack_integer('q', payload)
         if self.ptype == PTypeEnum.PtypString:
-            # Preventing the error:
-            # UnicodeDecodeError: 'utf16' codec can't decode bytes in position 0 - 1:
-            # illegal UTF - 16 surrogate
-            try:
-                return payload.decode('utf-16-le')  # unicode
-            except UnicodeDecodeError:
-                PANHuntException(
-                    'String property not correctly utf-16-le encoded, ignoring errors')
-                # unicode
-                return payload.decode('utf-16-le', errors='ignore')
+            # ignore illegal UTF-16 surrogates instead of raising UnicodeDecodeError
+            return payload.decode('utf-16-le', errors='ignore')
         if self.ptype == PTypeEnum.PtypString8:
-            if payload[-1:] == b'\x00':
-                return payload[:-1]
-            else:
-                return payload
+            return payload.rstrip(b'\x00')
         if self.ptype == PTypeEnum.PtypTime:
             return self.get_time(payload)
         if self.ptype == PTypeEnum.PtypGuid:
@@ -558,20 +718,21 @@ def get_value(self, payload: bytes) -> _ValueType:
         if self.ptype == PTypeEnum.PtypMultipleCurrency:
             raise NotImplementedError('PtypMultipleCurrency')
         if self.ptype == PTypeEnum.PtypMultipleFloatingTime:
-            count: int = len(payload) // 8
-            return [self.get_floating_time(payload[i * 8:(i + 1) * 8]) for i in range(count)]
+            return [_FLOATINGTIME_EPOCH + timedelta(days=days) for days in self.unpack_list_float(payload, 64)]
         if self.ptype == PTypeEnum.PtypMultipleInteger64:
             self.unpack_list_int(payload=payload, bit_size=64)
         if self.ptype == PTypeEnum.PtypMultipleString:
-            return ''.join([item_bytes.to_bytes(2, 'little').decode('utf-16-le') for item_bytes in payload])
+            # the value streams are concatenated, each string ends with a null character
+            values: list[str] = payload.decode(
+                'utf-16-le', errors='ignore').split('\x00')
+            return values[:-1] if values[-1] == '' else values
         if self.ptype == PTypeEnum.PtypMultipleString8:
             return payload  # list
         if self.ptype == PTypeEnum.PtypMultipleTime:
-            count = len(payload) // 8
-            return [self.get_time(payload[i * 8:(i + 1) * 8]) for i in range(count)]
+            return [_FILETIME_EPOCH + timedelta(microseconds=ticks / 10.0) for ticks in self.unpack_list_int(payload, 64)]
         if self.ptype == PTypeEnum.PtypMultipleGuid:
-            count = len(payload) // 16
-            return [payload[i * 16:(i + 1) * 16] for i in range(count)]
+            count: int = len(payload) // 16
+            return [guid for guid, in struct.iter_unpack('16s', payload[:count * 16])]
         if self.ptype == PTypeEnum.PtypMultipleBinary:
             return payload
         if self.ptype == PTypeEnum.PtypUnspecified:
@@ -585,37 +746,72 @@ def get_value(self, payload: bytes) -> _ValueType:
     def unpack_list_int(self, payload: bytes, bit_size: Literal[16, 32, 64]) -> list[int]:
         format_dict: dict[int, str] = {
             16: 'h', 32: 'i', 64: 'q'}
-        buffer_size = (bit_size // 8)
-        count: int = len(payload) // buffer_size
-        return [panutils.unpack_integer(
-            format_dict[bit_size], payload[i * buffer_size:(i + 1) * buffer_size]) for i in range(count)]
+        count: int = len(payload) // (bit_size // 8)
+        return list(struct.unpack_from(f'<{count}{format_dict[bit_size]}', payload))
 
     def unpack_list_float(self, payload: bytes, bit_size: Literal[32, 64]) -> list[float]:
         format_dict: dict[int, str] = {32: 'f', 64: 'd'}
-        buffer_size = (bit_size // 8)
-        count: int = len(payload) // buffer_size
-        return [panutils.unpack_float(
-            format_dict[bit_size], payload[i * buffer_size:(i + 1) * buffer_size]) for i in range(count)]
+        count: int = len(payload) // (bit_size // 8)
+        return list(struct.unpack_from(f'<{count}{format_dict[bit_size]}', payload))
 
     def get_floating_time(self, time_bytes: bytes) -> datetime:
 
-        return datetime(year=1899, month=12, day=30) + timedelta(days=panutils.unpack_float('d', time_bytes))
+        return _FLOATINGTIME_EPOCH + timedelta(days=_F64.unpack(time_bytes)[0])
 
     def get_time(self, time_bytes: bytes) -> datetime:
 
-        return datetime(year=1601, month=1, day=1) + timedelta(microseconds=panutils.unpack_integer('q', time_bytes) / 10.0)
+        return _FILETIME_EPOCH + timedelta(microseconds=_I64.unpack(time_bytes)[0] / 10.0)
 
     def get_multi_value_offsets(self, payload: bytes) -> tuple[int, list[int]]:
 
-        ul_count: int = panutils.unpack_integer('I', payload[:4])
-        rgul_data_offsets: list[int] = [panutils.unpack_integer(
-            'I', payload[(i + 1) * 4:(i + 2) * 4]) for i in range(ul_count)]
+        ul_count: int = _U32.unpack_from(payload)[0]
+        rgul_data_offsets: list[int] = list(
+            struct.unpack_from(f'<{ul_count}I', payload, 4))
 
         rgul_data_offsets.append(len(payload))
         return ul_count, rgul_data_offsets
 
 
+# read-only, the wrappers are shared by every message
+_PTYPE_MAPPING: Mapping[PTypeEnum, MsgPTypeWrapper] = MappingProxyType({
+    PTypeEnum.PtypInteger16: MsgPTypeWrapper(PTypeEnum.PtypInteger16, 2, False, False),
+    PTypeEnum.PtypInteger32: MsgPTypeWrapper(PTypeEnum.PtypInteger32, 4, False, False),
+    PTypeEnum.PtypFloating32: MsgPTypeWrapper(PTypeEnum.PtypFloating32, 4, False, False),
+    PTypeEnum.PtypFloating64: MsgPTypeWrapper(PTypeEnum.PtypFloating64, 8, False, False),
+    PTypeEnum.PtypCurrency: MsgPTypeWrapper(PTypeEnum.PtypCurrency, 8, False, False),
+    PTypeEnum.PtypFloatingTime: MsgPTypeWrapper(PTypeEnum.PtypFloatingTime, 8, False, False),
+    PTypeEnum.PtypErrorCode: MsgPTypeWrapper(PTypeEnum.PtypErrorCode, 4, False, False),
+    PTypeEnum.PtypBoolean: MsgPTypeWrapper(PTypeEnum.PtypBoolean, 1, False, False),
+    PTypeEnum.PtypInteger64: MsgPTypeWrapper(PTypeEnum.PtypInteger64, 8, False, False),
+    PTypeEnum.PtypString: MsgPTypeWrapper(PTypeEnum.PtypString, 0, True, False),
+    PTypeEnum.PtypString8: MsgPTypeWrapper(PTypeEnum.PtypString8, 0, True, False),
+    PTypeEnum.PtypTime: MsgPTypeWrapper(PTypeEnum.PtypTime, 8, False, False),
+    PTypeEnum.PtypGuid: MsgPTypeWrapper(PTypeEnum.PtypGuid, 16, False, False),
+    PTypeEnum.PtypServerId: MsgPTypeWrapper(PTypeEnum.PtypServerId, 2, False, True),
+    PTypeEnum.PtypRestriction: MsgPTypeWrapper(PTypeEnum.PtypRestriction, 0, True, False),
+    PTypeEnum.PtypRuleAction: MsgPTypeWrapper(PTypeEnum.PtypRuleAction, 2, False, True),
+    PTypeEnum.PtypBinary: MsgPTypeWrapper(PTypeEnum.PtypBinary, 2, False, True),
+    PTypeEnum.PtypMultipleInteger16: MsgPTypeWrapper(PTypeEnum.PtypMultipleInteger16, 2, False, True),
+    PTypeEnum.PtypMultipleInteger32: MsgPTypeWrapper(PTypeEnum.PtypMultipleInteger32, 2, False, True),
+    PTypeEnum.PtypMultipleFloating32: MsgPTypeWrapper(PTypeEnum.PtypMultipleFloating32, 2, False, True),
+    PTypeEnum.PtypMultipleFloating64: MsgPTypeWrapper(PTypeEnum.PtypMultipleFloating64, 2, False, True),
+    PTypeEnum.PtypMultipleCurrency: MsgPTypeWrapper(PTypeEnum.PtypMultipleCurrency, 2, False, True),
+    PTypeEnum.PtypMultipleFloatingTime: MsgPTypeWrapper(PTypeEnum.PtypMultipleFloatingTime, 2, False, True),
+    PTypeEnum.PtypMultipleInteger64: MsgPTypeWrapper(PTypeEnum.PtypMultipleInteger64, 2, False, True),
+    PTypeEnum.PtypMultipleString: MsgPTypeWrapper(PTypeEnum.PtypMultipleString, 2, True, True),
+    PTypeEnum.PtypMultipleString8: MsgPTypeWrapper(PTypeEnum.PtypMultipleString8, 2, True, True),
+    PTypeEnum.PtypMultipleTime: MsgPTypeWrapper(PTypeEnum.PtypMultipleTime, 2, False, True),
+    PTypeEnum.PtypMultipleGuid: MsgPTypeWrapper(PTypeEnum.PtypMultipleGuid, 2, False, True),
+    PTypeEnum.PtypMultipleBinary: MsgPTypeWrapper(PTypeEnum.PtypMultipleBinary, 2, False, True),
+    PTypeEnum.PtypUnspecified: MsgPTypeWrapper(PTypeEnum.PtypUnspecified, 0, False, False),
+    PTypeEnum.PtypNull: MsgPTypeWrapper(PTypeEnum.PtypNull, 0, False, False),
+    PTypeEnum.PtypObject: MsgPTypeWrapper(
+        PTypeEnum.PtypObject, 0, False, False)
+})
+
+
 class Recipient:
+    __slots__ = ('RecipientType', 'DisplayName', 'ObjectType', 'AddressType', 'EmailAddress', 'DisplayType')
     RecipientType: int
     DisplayName: str
     ObjectType: int
@@ -626,43 +822,45 @@ class Recipient:
     def __init__(self, prop_stream: PropertyStream) -> None:
 
         self.RecipientType = panutils.as_int(prop_stream.get_value(
-            PropIdEnum.PidTagRecipientType.value).value)
+            _PID_RECIPIENT_TYPE).value)
         self.DisplayName = panutils.as_str(prop_stream.get_value(
-            PropIdEnum.PidTagDisplayName.value).value)
+            _PID_DISPLAY_NAME).value)
         self.ObjectType = panutils.as_int(prop_stream.get_value(
-            PropIdEnum.PidTagObjectType.value).value)
+            _PID_OBJECT_TYPE).value)
         self.AddressType = panutils.as_str(prop_stream.get_value(
-            PropIdEnum.PidTagAddressType.value).value)
+            _PID_ADDRESS_TYPE).value)
         self.EmailAddress = panutils.as_str(prop_stream.get_value(
-            PropIdEnum.PidTagEmailAddress.value).value)
+            _PID_EMAIL_ADDRESS).value)
         self.DisplayType = panutils.as_int(prop_stream.get_value(
-            PropIdEnum.PidTagDisplayType.value).value)
+            _PID_DISPLAY_TYPE).value)
 
     def __str__(self) -> str:
         return f"{self.DisplayName} ({self.EmailAddress})"
 
 
 class Attachment:
+    __slots__ = ('DisplayName', 'AttachMethod', 'AttachmentSize', 'AttachFilename', 'AttachLongFilename', 'Filename',
+                 'BinaryData', 'AttachMimeTag', 'AttachExtension')
     DisplayName: str
     AttachMethod: int
     AttachmentSize: int
     AttachFilename: str
     AttachLongFilename: str
     Filename: str
-    BinaryData: Optional[bytes] = None
+    BinaryData: Optional[bytes]
     AttachMimeTag: str
     AttachExtension: str
 
     def __init__(self, prop_stream: PropertyStream) -> None:
 
         self.DisplayName = panutils.as_str(prop_stream.get_value(
-            PropIdEnum.PidTagDisplayName.value).value)
+            _PID_DISPLAY_NAME).value)
         self.AttachMethod = panutils.as_int(prop_stream.get_value(
-            PropIdEnum.PidTagAttachMethod.value).value)
+            _PID_ATTACH_METHOD).value)
         self.AttachFilename = panutils.as_str(prop_stream.get_value(
-            PropIdEnum.PidTagAttachFilename.value).value)
+            _PID_ATTACH_FILENAME).value)
         self.AttachLongFilename = panutils.as_str(prop_stream.get_value(
-            PropIdEnum.PidTagAttachLongFilename.value).value)
+            _PID_ATTACH_LONG_FILENAME).value)
         if self.AttachLongFilename:
             self.Filename = self.AttachLongFilename
         else:
@@ -672,17 +870,17 @@ def __init__(self, prop_stream: PropertyStream) -> None:
         else:
             self.Filename = f'[NoFilename_Method{self.AttachMethod}]'
         self.BinaryData = panutils.as_binary(prop_stream.get_value(
-            PropIdEnum.PidTagAttachDataBinary.value).value)
+            _PID_ATTACH_DATA_BINARY).value)
         self.AttachExtension = panutils.as_str(prop_stream.get_value(
-            PropIdEnum.PidTagAttachExtension.value).value)
+            _PID_ATTACH_EXTENSION).value)
         # If the msg file is from a draft, then
         # values below are null
         sz: Optional[PropertyEntry] = prop_stream.get_value(
-            PropIdEnum.PidTagAttachmentSize.value)
+            _PID_ATTACHMENT_SIZE)
         if sz:
             self.AttachmentSize = panutils.as_int(sz.value)
         amt: Optional[PropertyEntry] = prop_stream.get_value(
-            PropIdEnum.PidTagAttachMimeTag.value)
+            _PID_ATTACH_MIME_TAG)
         if amt:
             self.AttachMimeTag = panutils.as_str(amt.value)
 
@@ -696,31 +894,23 @@ def __str__(self) -> str:
 
 class MSMSG:
 
+    # __dict__ only backs the cached header properties, so it is not allocated unless one of them is read
+    __slots__ = ('cfb', 'validMSG', 'root_dir_entry', 'prop_stream', 'recipients', 'attachments', 'indexed_children',
+                 'Body', '__dict__')
     cfb: MSCFB
     validMSG: bool
     root_dir_entry: DirectoryEntry
     prop_stream: PropertyStream
     recipients: list[Recipient]
     attachments: list[Attachment]
-    ptype_mapping: dict[PTypeEnum, MsgPTypeWrapper]
-    Subject: str
-    ClientSubmitTime: Optional[datetime]
-    SentRepresentingName: str
-    SenderName: str
-    SenderSmtpAddress: str
-    MessageDeliveryTime: datetime
-    MessageFlags: int
-    MessageStatus: int
-    MessageSize: int
+    indexed_children: dict[str, list[DirectoryEntry]]
+    # shared by all messages, built once at import
+    ptype_mapping: Mapping[PTypeEnum, MsgPTypeWrapper] = _PTYPE_MAPPING
     Body: str
-    TransportMessageHeaders: str
-    DisplayTo: str
-    XOriginatingIP: str
 
     def __init__(self, msg_file_path: _FilePathOrFileObject) -> None:
-        """msg_file is unicode or string filename or a file object"""
+        """msg_file is unicode or string filename, a file object or an in memory BytesIO"""
 
-        self.set_property_types()
         self.cfb = MSCFB(msg_file_path)
         self.validMSG = self.cfb.validCFB
 
@@ -732,139 +922,149 @@ def __init__(self, msg_file_path: _FilePathOrFileObject) -> None:
             self, self.root_dir_entry, PropertyStream.TOPLEVEL_HEADER_SIZE)  # root
 
         self.set_common_properties()
+        self.set_indexed_children()
         self.set_recipients()
         self.set_attachments()
 
     def set_common_properties(self) -> None:
 
-        self.Subject = panutils.as_str(self.prop_stream.get_value(
-            PropIdEnum.PidTagSubjectW.value).value)
+        self.Body = panutils.as_str(self.prop_stream.get_value(
+            _PID_BODY).value)
 
-        self.MessageFlags = panutils.as_int(self.prop_stream.get_value(
-            PropIdEnum.PidTagMessageFlags.value).value)
-        # self.HasAttachments  = (self.MessageFlags & Message.mfHasAttach == Message.mfHasAttach)
+    # The scanner only reads the body and attachments, so the header properties are decoded on first access.
 
-        self.Body = panutils.as_str(self.prop_stream.get_value(
-            PropIdEnum.PidTagBody.value).value)
+    @cached_property
+    def Subject(self) -> Optional[str]:
+
+        sub: Optional[PropertyEntry] = self.prop_stream.get_value(_PID_SUBJECT)
+        return panutils.as_str(sub.value) if sub else None
 
-        self.DisplayTo = panutils.as_str(self.prop_stream.get_value(
-            PropIdEnum.PidTagDisplayToW.value).value)
+    @cached_property
+    def MessageFlags(self) -> Optional[int]:
 
+        mf: Optional[PropertyEntry] = self.prop_stream.get_value(
+            _PID_MESSAGE_FLAGS)
+        # self.HasAttachments  = (self.MessageFlags & Message.mfHasAttach == Message.mfHasAttach)
         # self.Read = (self.MessageFlags & Message.mfRead == Message.mfRead)
-        # If the msg file is from a draft, then
-        # values below are null
+        return panutils.as_int(mf.value) if mf else None
+
+    @cached_property
+    def DisplayTo(self) -> Optional[str]:
+
+        dt: Optional[PropertyEntry] = self.prop_stream.get_value(
+            _PID_DISPLAY_TO)
+        return panutils.as_str(dt.value) if dt else None
+
+    # If the msg file is from a draft, then the properties below are null.
+
+    @cached_property
+    def ClientSubmitTime(self) -> Optional[datetime]:
+
         cst: Optional[PropertyEntry] = self.prop_stream.get_value(
-            PropIdEnum.PidTagClientSubmitTime.value)
-        if cst:
-            self.ClientSubmitTime = panutils.as_datetime(cst.value)
+            _PID_CLIENT_SUBMIT_TIME)
+        return panutils.as_datetime(cst.value) if cst else None
+
+    @cached_property
+    def SentRepresentingName(self) -> Optional[str]:
 
         srt: Optional[PropertyEntry] = self.prop_stream.get_value(
-            PropIdEnum.PidTagSentRepresentingNameW.value)
-        if srt:
-            self.SentRepresentingName = panutils.as_str(srt.value)
+            _PID_SENT_REPRESENTING_NAME)
+        return panutils.as_str(srt.value) if srt else None
+
+    @cached_property
+    def SenderName(self) -> Optional[str]:
 
         sn: Optional[PropertyEntry] = self.prop_stream.get_value(
-            PropIdEnum.PidTagSenderName.value)
-        if sn:
-            self.SenderName = panutils.as_str(sn.value)
+            _PID_SENDER_NAME)
+        return panutils.as_str(sn.value) if sn else None
+
+    @cached_property
+    def SenderSmtpAddress(self) -> Optional[str]:
 
         ssa: Optional[PropertyEntry] = self.prop_stream.get_value(
-            PropIdEnum.PidTagSenderSmtpAddress.value)
-        if ssa:
-            self.SenderSmtpAddress = panutils.as_str(ssa.value)
+            _PID_SENDER_SMTP_ADDRESS)
+        return panutils.as_str(ssa.value) if ssa else None
+
+    @cached_property
+    def MessageDeliveryTime(self) -> Optional[datetime]:
 
         mdt: Optional[PropertyEntry] = self.prop_stream.get_value(
-            PropIdEnum.PidTagMessageDeliveryTime.value)
-        if mdt:
-            self.MessageDeliveryTime = panutils.as_datetime(mdt.value)
+            _PID_MESSAGE_DELIVERY_TIME)
+        return panutils.as_datetime(mdt.value) if mdt else None
+
+    @cached_property
+    def MessageStatus(self) -> Optional[int]:
 
         ms: Optional[PropertyEntry] = self.prop_stream.get_value(
-            PropIdEnum.PidTagMessageStatus.value)
-        if ms:
-            self.MessageStatus = panutils.as_int(ms.value)
+            _PID_MESSAGE_STATUS)
+        return panutils.as_int(ms.value) if ms else None
+
+    @cached_property
+    def MessageSize(self) -> Optional[int]:
 
         msz: Optional[PropertyEntry] = self.prop_stream.get_value(
-            PropIdEnum.PidTagMessageSize.value)
-        if msz:
-            self.MessageSize = panutils.as_int(msz.value)
+            _PID_MESSAGE_SIZE)
+        return panutils.as_int(msz.value) if msz else None
+
+    @cached_property
+    def TransportMessageHeaders(self) -> Optional[str]:
 
         tmh: Optional[PropertyEntry] = self.prop_stream.get_value(
-            PropIdEnum.PidTagTransportMessageHeaders.value)
-        if tmh:
-            self.TransportMessageHeaders = panutils.as_str(tmh.value)
+            _PID_TRANSPORT_MESSAGE_HEADERS)
+        return panutils.as_str(tmh.value) if tmh else None
+
+    @cached_property
+    def XOriginatingIP(self) -> Optional[str]:
 
         x: Optional[PropertyEntry] = self.prop_stream.get_value(
-            PropIdEnum.PidTagXOriginatingIp.value)
-        if x:
-            self.XOriginatingIP = panutils.as_str(x.value)  # x-originating-ip
+            _PID_X_ORIGINATING_IP)
+        return panutils.as_str(x.value) if x else None  # x-originating-ip
 
     def set_recipients(self) -> None:
 
         self.recipients = []
-        recipient_dir_index: int = 0
-        while True:
-            recipient_dir_name: str = f'__recip_version1.0_#{panutils.to_zeropaddedhex(recipient_dir_index, 8)}'
-            if recipient_dir_name in list(self.root_dir_entry.children.keys()):
-                recipient_dir_entry: DirectoryEntry = self.root_dir_entry.children[
-                    recipient_dir_name]
-                rps: PropertyStream = PropertyStream(
-                    self, recipient_dir_entry, PropertyStream.RECIP_OR_ATTACH_HEADER_SIZE)
-                recipient: Recipient = Recipient(rps)
-                self.recipients.append(recipient)
-                recipient_dir_index += 1
+        header_size: int = PropertyStream.RECIP_OR_ATTACH_HEADER_SIZE
+        # Recipient copies its values out, so one stream is reset for each recipient storage
+        rps: Optional[PropertyStream] = None
+        for recipient_dir_entry in self.get_indexed_children('__recip_version1.0_#'):
+            if rps is None:
+                rps = PropertyStream(self, recipient_dir_entry, header_size)
             else:
-                break
+                rps.reset(recipient_dir_entry, header_size)
+            recipient: Recipient = Recipient(rps)
+            self.recipients.append(recipient)
 
     def set_attachments(self) -> None:
         self.attachments = []
-        attachment_dir_index: int = 0
-        while True:
-            attachment_dir_name: str = f'__attach_version1.0_#{panutils.to_zeropaddedhex(attachment_dir_index, 8)}'
-            if attachment_dir_name in list(self.root_dir_entry.children.keys()):
-                attachment_dir_entry: DirectoryEntry = self.root_dir_entry.children[
-                    attachment_dir_name]
-                aps: PropertyStream = PropertyStream(
-                    self, attachment_dir_entry, PropertyStream.RECIP_OR_ATTACH_HEADER_SIZE)
-                attachment: Attachment = Attachment(aps)
-                self.attachments.append(attachment)
-                attachment_dir_index += 1
+        header_size: int = PropertyStream.RECIP_OR_ATTACH_HEADER_SIZE
+        # Attachment copies its values out, so one stream is reset for each attachment storage
+        aps: Optional[PropertyStream] = None
+        for attachment_dir_entry in self.get_indexed_children('__attach_version1.0_#'):
+            if aps is None:
+                aps = PropertyStream(self, attachment_dir_entry, header_size)
             else:
-                break
-
-    def set_property_types(self) -> None:
-
-        self.ptype_mapping = {
-            PTypeEnum.PtypInteger16: MsgPTypeWrapper(PTypeEnum.PtypInteger16, 2, False, False),
-            PTypeEnum.PtypInteger32: MsgPTypeWrapper(PTypeEnum.PtypInteger32, 4, False, False),
-            PTypeEnum.PtypFloating32: MsgPTypeWrapper(PTypeEnum.PtypFloating32, 4, False, False),
-            PTypeEnum.PtypFloating64: MsgPTypeWrapper(PTypeEnum.PtypFloating64, 8, False, False),
-            PTypeEnum.PtypCurrency: MsgPTypeWrapper(PTypeEnum.PtypCurrency, 8, False, False),
-            PTypeEnum.PtypFloatingTime: MsgPTypeWrapper(PTypeEnum.PtypFloatingTime, 8, False, False),
-            PTypeEnum.PtypErrorCode: MsgPTypeWrapper(PTypeEnum.PtypErrorCode, 4, False, False),
-            PTypeEnum.PtypBoolean: MsgPTypeWrapper(PTypeEnum.PtypBoolean, 1, False, False),
-            PTypeEnum.PtypInteger64: MsgPTypeWrapper(PTypeEnum.PtypInteger64, 8, False, False),
-            PTypeEnum.PtypString: MsgPTypeWrapper(PTypeEnum.PtypString, 0, True, False),
-            PTypeEnum.PtypString8: MsgPTypeWrapper(PTypeEnum.PtypString8, 0, True, False),
-            PTypeEnum.PtypTime: MsgPTypeWrapper(PTypeEnum.PtypTime, 8, False, False),
-            PTypeEnum.PtypGuid: MsgPTypeWrapper(PTypeEnum.PtypGuid, 16, False, False),
-            PTypeEnum.PtypServerId: MsgPTypeWrapper(PTypeEnum.PtypServerId, 2, False, True),
-            PTypeEnum.PtypRestriction: MsgPTypeWrapper(PTypeEnum.PtypRestriction, 0, True, False),
-            PTypeEnum.PtypRuleAction: MsgPTypeWrapper(PTypeEnum.PtypRuleAction, 2, False, True),
-            PTypeEnum.PtypBinary: MsgPTypeWrapper(PTypeEnum.PtypBinary, 2, False, True),
-            PTypeEnum.PtypMultipleInteger16: MsgPTypeWrapper(PTypeEnum.PtypMultipleInteger16, 2, False, True),
-            PTypeEnum.PtypMultipleInteger32: MsgPTypeWrapper(PTypeEnum.PtypMultipleInteger32, 2, False, True),
-            PTypeEnum.PtypMultipleFloating32: MsgPTypeWrapper(PTypeEnum.PtypMultipleFloating32, 2, False, True),
-            PTypeEnum.PtypMultipleFloating64: MsgPTypeWrapper(PTypeEnum.PtypMultipleFloating64, 2, False, True),
-            PTypeEnum.PtypMultipleCurrency: MsgPTypeWrapper(PTypeEnum.PtypMultipleCurrency, 2, False, True),
-            PTypeEnum.PtypMultipleFloatingTime: MsgPTypeWrapper(PTypeEnum.PtypMultipleFloatingTime, 2, False, True),
-            PTypeEnum.PtypMultipleInteger64: MsgPTypeWrapper(PTypeEnum.PtypMultipleInteger64, 2, False, True),
-            PTypeEnum.PtypMultipleString: MsgPTypeWrapper(PTypeEnum.PtypMultipleString, 2, True, True),
-            PTypeEnum.PtypMultipleString8: MsgPTypeWrapper(PTypeEnum.PtypMultipleString8, 2, True, True),
-            PTypeEnum.PtypMultipleTime: MsgPTypeWrapper(PTypeEnum.PtypMultipleTime, 2, False, True),
-            PTypeEnum.PtypMultipleGuid: MsgPTypeWrapper(PTypeEnum.PtypMultipleGuid, 2, False, True),
-            PTypeEnum.PtypMultipleBinary: MsgPTypeWrapper(PTypeEnum.PtypMultipleBinary, 2, False, True),
-            PTypeEnum.PtypUnspecified: MsgPTypeWrapper(PTypeEnum.PtypUnspecified, 0, False, False),
-            PTypeEnum.PtypNull: MsgPTypeWrapper(PTypeEnum.PtypNull, 0, False, False),
-            PTypeEnum.PtypObject: MsgPTypeWrapper(
-                PTypeEnum.PtypObject, 0, False, False)
-        }
+                aps.reset(attachment_dir_entry, header_size)
+            attachment: Attachment = Attachment(aps)
+            self.attachments.append(attachment)
+
+    def set_indexed_children(self) -> None:
+        """groups the root storages named prefix#<hex index> by prefix, in index order"""
+
+        indexed_children: dict[str, list[tuple[int, DirectoryEntry]]] = {}
+        for name, dir_entry in self.root_dir_entry.children.items():
+            prefix, separator, index = name.partition('#')
+            if separator:
+                try:
+                    indexed_children.setdefault(prefix + separator, []).append(
+                        (int(index, 16), dir_entry))
+                except ValueError:
+                    continue
+        self.indexed_children = {}
+        for prefix, children in indexed_children.items():
+            children.sort(key=lambda indexed_child: indexed_child[0])
+            self.indexed_children[prefix] = [
+                dir_entry for _, dir_entry in children]
+
+    def get_indexed_children(self, prefix: str) -> list[DirectoryEntry]:
+
+        return self.indexed_children.get(prefix, [])
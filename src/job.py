@@ -51,6 +51,15 @@ def dequeue(self) -> Optional[Job]:
             return job
         return None
 
+    def drain(self) -> list[Job]:
+        """Pop every queued job without processing it and return them."""
+        jobs: list[Job] = []
+        with self._lock:
+            while not self._job_queue.empty():
+                jobs.append(self._job_queue.get_nowait())
+            self._jobs_enqueued -= len(jobs)
+        return jobs
+
     def complete_job(self) -> None:
         """Decrement the in-progress job count and increment the processed job count."""
         with self._lock:
@@ -11,6 +11,7 @@
 
 import argparse
 import logging
+import multiprocessing
 import os
 import sys
 from datetime import datetime
@@ -158,6 +159,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Required for the MSG scan worker processes in frozen builds
+    multiprocessing.freeze_support()
     try:
         main()
         logging.info('Exiting')
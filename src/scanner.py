@@ -1,8 +1,10 @@
 import io
+import logging
 import os
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from config import PANHuntConfiguration
 from formats.eml import Eml
 from job import Job, JobQueue
 from formats.mbox import Mbox
@@ -18,6 +20,8 @@
 
 
 class ScannerBase(ABC):
+    # scanners whose work is self-contained CPU-bound parsing can run in a worker process
+    parallel: bool = False
 
     @abstractmethod
     def scan(self, job: Job, encoding: str = 'utf8') -> list[PAN]:
@@ -61,12 +65,13 @@ def scan(self, job: Job, encoding: str = 'utf8') -> list[PAN]:
 
 
 class MsgScanner(ScannerBase):
+    parallel = True
 
     def scan(self, job: Job, encoding: str = 'utf8') -> list[PAN]:
 
         msg: MSMSG
         if job.payload:
-            msg = MSMSG(msg_file_path=job.payload)
+            msg = MSMSG(msg_file_path=io.BytesIO(initial_bytes=job.payload))
         else:
             msg = MSMSG(msg_file_path=job.abspath)
 
@@ -90,6 +95,29 @@ def scan(self, job: Job, encoding: str = 'utf8') -> list[PAN]:
         return matches
 
 
+def init_worker(excluded_pans: list[str], log_file: Optional[str], log_encoding: Optional[str],
+                log_format: str, log_datefmt: Optional[str], log_level: int) -> None:
+    """Carry the settings PAN matching depends on, and the logging set up in main(), over to a worker process."""
+    PANHuntConfiguration().excluded_pans = excluded_pans
+    if log_file:
+        logging.basicConfig(filename=log_file,
+                            encoding=log_encoding,
+                            format=log_format,
+                            datefmt=log_datefmt,
+                            level=log_level)
+
+
+def scan_in_worker(scanner: type[ScannerBase], job: Job, encoding: str) -> tuple[list[PAN], list[Job]]:
+    """Run a scanner in a worker process.
+    The child jobs it enqueues are returned with the matches so that they can be enqueued in the main process."""
+    try:
+        matches: list[PAN] = scanner().scan(job=job, encoding=encoding)
+    finally:
+        # drained when the scan raises too, so its children are not returned with the worker's next job
+        children: list[Job] = JobQueue().drain()
+    return matches, children
+
+
 class EmlScanner(ScannerBase):
 
     def scan(self, job: Job, encoding: str = 'utf8') -> list[PAN]: